@@ -6,27 +6,43 @@ Features:
 - Grid placement of 4 building types
 - Money, population, happiness, energy systems
 - Income tick every second
-- Save / Load to JSON
+- Save / Load to a compact binary file (or JSON for .json paths)
 - Simple UI and basic balancing
 
 Author: ChatGPT (adapted for you)
 """
 
 import pygame
+import numpy as np
 import sys
 import json
 import os
+import struct
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+# orjson is optional; it speeds up reading .json saves (including the legacy
+# save picked up by City.load) and the stdlib is used without it
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # ------ Config ------
 CELL = 64
 GRID_W, GRID_H = 10, 7
+GRID_PX_W, GRID_PX_H = GRID_W * CELL, GRID_H * CELL
 UI_WIDTH = 300
-WIDTH = GRID_W * CELL + UI_WIDTH
-HEIGHT = GRID_H * CELL
+WIDTH = GRID_PX_W + UI_WIDTH
+HEIGHT = GRID_PX_H
 FPS = 60
-SAVE_FILE = "city_tycoon_save.json"
+SAVE_FILE = "city_tycoon_save.bin"
+LEGACY_SAVE_FILE = "city_tycoon_save.json"  # loaded when no binary save exists yet
+# Binary save layout: magic/version prefix, one header, then one fixed-size record per building
+SAVE_MAGIC = b"CTY\x01"
+SAVE_HEADER = struct.Struct("<qqd")   # money, population, happiness
+SAVE_RECORD = struct.Struct("<iiid")  # bid, x, y, placed_at
 
 # Colors
 WHITE = (245, 245, 245)
@@ -47,9 +63,10 @@ pygame.display.set_caption("City Tycoon (mini)")
 clock = pygame.time.Clock()
 FONT = pygame.font.SysFont("consolas", 18)
 BIG = pygame.font.SysFont("consolas", 28, bold=True)
+SMALL_FONT = pygame.font.SysFont("consolas", 14)
 
 # ------ Game Data ------
-@dataclass
+@dataclass(slots=True)
 class BuildingDef:
     id: int
     name: str
@@ -68,16 +85,13 @@ BUILDINGS = [
 ]
 BUILDING_BY_ID = {b.id: b for b in BUILDINGS}
 
-@dataclass
+@dataclass(slots=True)
 class PlacedBuilding:
     bid: int
     x: int
     y: int
     placed_at: float
 
-    def to_json(self):
-        return asdict(self)
-
     @staticmethod
     def from_json(d):
         return PlacedBuilding(d["bid"], d["x"], d["y"], d["placed_at"])
@@ -89,71 +103,93 @@ class City:
         self.population = 0
         self.happiness = 0.6  # 0..1
         self.energy = 0
-        self.grid = [[None for _ in range(GRID_H)] for _ in range(GRID_W)]
+        self.grid = np.zeros((GRID_W, GRID_H), np.int16)  # building id per cell, 0 = empty
         self.buildings = []  # list of PlacedBuilding
-        self.tick_accum = 0.0
+        self.bindex = {}  # (x, y) -> index into self.buildings
+        self.blit_seq = []  # (icon, pixel pos) per building, parallel to self.buildings
+        # running per-tick totals, updated on place/demolish so tick() stays O(1)
+        self.sum_income = 0
+        self.sum_upkeep = 0
+        self.sum_energy_pos = 0
+        self.sum_energy_neg = 0
+        self.pop_from_houses = 0
         self.tick_interval = 1.0  # seconds
         self.running = True
         self.selected_building = 1
         self.last_tick_time = time.time()
-
-    def can_place(self, gx, gy):
-        if not (0 <= gx < GRID_W and 0 <= gy < GRID_H):
-            return False
-        return self.grid[gx][gy] is None
+        self.dirty = True  # screen needs a redraw
+        # (value, rendered surface) pairs for the UI stat lines
+        self._cached_money = (None, None)
+        self._cached_population = (None, None)
+        self._cached_happiness = (None, None)
+        self._cached_energy = (None, None)
 
     def place(self, bx, by, bid):
         if not (0 <= bx < GRID_W and 0 <= by < GRID_H):
             return False, "Out of bounds"
-        if self.grid[bx][by] is not None:
+        if self.grid[bx, by] != 0:
             return False, "Cell occupied"
         bdef = BUILDING_BY_ID[bid]
         if self.money < bdef.cost:
             return False, "Not enough money"
         self.money -= bdef.cost
         pb = PlacedBuilding(bid, bx, by, time.time())
+        self.bindex[(bx, by)] = len(self.buildings)
         self.buildings.append(pb)
-        self.grid[bx][by] = pb
+        self.blit_seq.append((ICON_CACHE[bid], (bx * CELL, by * CELL)))
+        self.grid[bx, by] = bid
+        self._track(bdef, 1)
+        self.dirty = True
         # apply immediate static effects
         self.population += bdef.pop
         self.energy += bdef.energy
-        self.happiness = clamp(self.happiness + bdef.happiness * 0.5, 0.0, 1.0)
+        self.happiness = max(0.0, min(1.0, self.happiness + bdef.happiness * 0.5))
         return True, "Placed"
 
     def demolish(self, bx, by):
         if not (0 <= bx < GRID_W and 0 <= by < GRID_H):
             return False, "Out of bounds"
-        pb = self.grid[bx][by]
-        if pb is None:
+        i = self.bindex.get((bx, by))
+        if i is None:
             return False, "Empty"
+        pb = self.buildings[i]
         bdef = BUILDING_BY_ID[pb.bid]
         refund = int(bdef.cost * 0.5)
         self.money += refund
+        self._track(bdef, -1)
+        self.dirty = True
         # remove effects
         self.population -= bdef.pop
         self.energy -= bdef.energy
-        self.happiness = clamp(self.happiness - bdef.happiness * 0.5, 0.0, 1.0)
-        self.buildings.remove(pb)
-        self.grid[bx][by] = None
+        self.happiness = max(0.0, min(1.0, self.happiness - bdef.happiness * 0.5))
+        # swap-pop: move the last building into the freed slot
+        del self.bindex[(bx, by)]
+        last = self.buildings.pop()
+        last_blit = self.blit_seq.pop()
+        if i != len(self.buildings):
+            self.buildings[i] = last
+            self.blit_seq[i] = last_blit
+            self.bindex[(last.x, last.y)] = i
+        self.grid[bx, by] = 0
         return True, f"Demolished (+${refund})"
 
+    def _track(self, bdef, sign):
+        # add (sign=1) or remove (sign=-1) a building's contribution to the running totals
+        self.sum_income += sign * bdef.income
+        self.sum_upkeep += sign * bdef.upkeep
+        if bdef.energy > 0:
+            self.sum_energy_pos += sign * bdef.energy
+        else:
+            self.sum_energy_neg -= sign * bdef.energy
+        self.pop_from_houses += sign * bdef.pop
+
     def tick(self):
         # Called every tick_interval
-        total_income = 0
-        total_upkeep = 0
-        produced_energy = 0
-        req_energy = 0
-        pop_from_houses = 0
-
-        for pb in self.buildings:
-            b = BUILDING_BY_ID[pb.bid]
-            if b.energy > 0:
-                produced_energy += b.energy
-            elif b.energy < 0:
-                req_energy += -b.energy
-            total_income += b.income
-            total_upkeep += b.upkeep
-            pop_from_houses += b.pop
+        total_income = self.sum_income
+        total_upkeep = self.sum_upkeep
+        produced_energy = self.sum_energy_pos
+        req_energy = self.sum_energy_neg
+        pop_from_houses = self.pop_from_houses
 
         # population already tracked on place/demolish; ensure it's non-negative
         self.population = max(0, self.population)
@@ -163,10 +199,10 @@ class City:
 
         # happiness drifts slightly toward an equilibrium affected by city
         # Basic rules: more population slightly reduces happiness; powerplants reduce it
-        pop_effect = clamp(0.02 - (self.population * 0.001), -0.3, 0.05)
+        pop_effect = max(-0.3, min(0.05, 0.02 - (self.population * 0.001)))
         energy_effect = 0.05 if self.energy >= 0 else -0.12
         # small random-ish charm avoided to keep deterministic
-        self.happiness = clamp(self.happiness + pop_effect + energy_effect * 0.02, 0.0, 1.0)
+        self.happiness = max(0.0, min(1.0, self.happiness + pop_effect + energy_effect * 0.02))
 
         # income multiplier based on happiness and energy
         happiness_mult = 0.8 + self.happiness * 0.8   # 0.8..1.6
@@ -184,6 +220,7 @@ class City:
             growth = int(pop_from_houses * 0.02)
             self.population += growth
 
+        self.dirty = True
         return {
             "income_base": total_income,
             "upkeep": total_upkeep,
@@ -193,68 +230,184 @@ class City:
             "happiness": self.happiness,
         }
 
+    def stat_surface(self, name, value, fmt, color=WHITE):
+        # only re-render the text when the displayed value actually changed
+        cached = getattr(self, "_cached_" + name)
+        if cached[0] != value:
+            cached = (value, render_text(fmt.format(value), color=color))
+            setattr(self, "_cached_" + name, cached)
+        return cached[1]
+
     def reset(self):
         self.__init__()
 
     def save(self, filename=SAVE_FILE):
         try:
-            data = {
-                "money": self.money,
-                "population": self.population,
-                "happiness": self.happiness,
-                "buildings": [pb.to_json() for pb in self.buildings],
-            }
-            with open(filename, "w") as f:
-                json.dump(data, f, indent=2)
+            if filename.endswith(".json"):
+                # written straight to the file, one building at a time
+                with open(filename, "w") as f:
+                    f.write('{"money":%d,"population":%d,"happiness":%r,"buildings":['
+                            % (self.money, self.population, self.happiness))
+                    sep = ""
+                    for pb in self.buildings:
+                        f.write('%s{"bid":%d,"x":%d,"y":%d,"placed_at":%r}'
+                                % (sep, pb.bid, pb.x, pb.y, pb.placed_at))
+                        sep = ","
+                    f.write("]}")
+            else:
+                with open(filename, "wb") as f:
+                    f.write(SAVE_MAGIC)
+                    f.write(SAVE_HEADER.pack(self.money, self.population, self.happiness))
+                    f.write(b"".join(SAVE_RECORD.pack(pb.bid, pb.x, pb.y, pb.placed_at) for pb in self.buildings))
             return True, "Saved"
         except Exception as e:
             return False, str(e)
 
     def load(self, filename=SAVE_FILE):
+        if filename == SAVE_FILE and not os.path.exists(filename) and os.path.exists(LEGACY_SAVE_FILE):
+            filename = LEGACY_SAVE_FILE
         if not os.path.exists(filename):
             return False, "Save not found"
         try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-            self.money = int(data.get("money", 0))
-            self.population = int(data.get("population", 0))
-            self.happiness = float(data.get("happiness", 0.6))
-            # clear grid
-            self.grid = [[None for _ in range(GRID_H)] for _ in range(GRID_W)]
-            self.buildings = []
-            for bd in data.get("buildings", []):
-                pb = PlacedBuilding.from_json(bd)
-                self.buildings.append(pb)
-                if 0 <= pb.x < GRID_W and 0 <= pb.y < GRID_H:
-                    self.grid[pb.x][pb.y] = pb
-            # recalc energy and pop (in case)
-            self.energy = sum(BUILDING_BY_ID[pb.bid].energy for pb in self.buildings)
+            if filename.endswith(".json"):
+                with open(filename, "rb") as f:
+                    data = _loads(f.read())
+                money = int(data.get("money", 0))
+                population = int(data.get("population", 0))
+                happiness = float(data.get("happiness", 0.6))
+                buildings = [PlacedBuilding.from_json(bd) for bd in data.get("buildings", [])]
+            else:
+                with open(filename, "rb") as f:
+                    raw = f.read()
+                if not raw.startswith(SAVE_MAGIC):
+                    return False, "Not a City Tycoon save"
+                money, population, happiness = SAVE_HEADER.unpack_from(raw, len(SAVE_MAGIC))
+                records = memoryview(raw)[len(SAVE_MAGIC) + SAVE_HEADER.size:]
+                buildings = [PlacedBuilding(*rec) for rec in SAVE_RECORD.iter_unpack(records)]
+            # check every record and build the derived state in locals,
+            # so a bad save leaves the current city untouched
+            bindex = {}
+            for i, pb in enumerate(buildings):
+                if pb.bid not in BUILDING_BY_ID:
+                    return False, f"Unknown building id {pb.bid}"
+                if not (isinstance(pb.x, int) and isinstance(pb.y, int)
+                        and isinstance(pb.placed_at, (int, float))):
+                    return False, f"Bad building record {pb}"
+                if (pb.x, pb.y) in bindex:
+                    return False, f"Overlapping buildings at ({pb.x}, {pb.y})"
+                bindex[(pb.x, pb.y)] = i
+            on_grid = [pb for pb in buildings if 0 <= pb.x < GRID_W and 0 <= pb.y < GRID_H]
+            grid = np.zeros((GRID_W, GRID_H), np.int16)
+            if on_grid:
+                xs, ys = np.array([(pb.x, pb.y) for pb in on_grid], np.intp).T
+                grid[xs, ys] = [pb.bid for pb in on_grid]
+            blit_seq = [(ICON_CACHE[pb.bid], (pb.x * CELL, pb.y * CELL)) for pb in buildings]
+
+            self.money = money
+            self.population = population
+            self.happiness = happiness
+            self.grid = grid
+            self.buildings = buildings
+            self.bindex = bindex
+            self.blit_seq = blit_seq
+            self.sum_income = self.sum_upkeep = 0
+            self.sum_energy_pos = self.sum_energy_neg = 0
+            self.pop_from_houses = 0
+            for pb in buildings:
+                self._track(BUILDING_BY_ID[pb.bid], 1)
+            # recalc energy (in case)
+            self.energy = self.sum_energy_pos - self.sum_energy_neg
+            self.dirty = True
             return True, "Loaded"
         except Exception as e:
             return False, str(e)
 
-def clamp(v, a, b):
-    return max(a, min(b, v))
-
 # ------ Rendering helpers ------
+def render_text(text, font=FONT, color=WHITE):
+    # for text that is cached and blitted many times: convert once to the display format
+    return font.render(text, True, color).convert_alpha()
+
 def draw_text(surf, text, pos, font=FONT, color=WHITE):
     txt = font.render(text, True, color)
     surf.blit(txt, pos)
 
-def draw_building_icon(surf, rect, bid):
-    b = BUILDING_BY_ID[bid]
-    # simple icon: colored rect + initial
+def _make_icon(b):
+    # simple icon: colored rect + initial, on a transparent cell-sized surface
     color = {
         1: GREEN,
         2: ORANGE,
         3: BROWN,
         4: GRAY
-    }[bid]
-    inner = rect.inflate(-8, -8)
+    }[b.id]
+    surf = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+    inner = surf.get_rect().inflate(-8, -8)
     pygame.draw.rect(surf, color, inner)
     initial = BIG.render(b.name[0], True, BLACK)
     ic = initial.get_rect(center=inner.center)
     surf.blit(initial, ic)
+    return surf.convert_alpha()
+
+ICON_CACHE = {b.id: _make_icon(b) for b in BUILDINGS}
+
+# Static UI text, rendered once: (surface, y) pairs drawn at the panel's left margin
+TITLE_TEXT = render_text("City Tycoon (mini)", BIG, YELLOW)
+CONTROLS_TEXT = (
+    (render_text("Controls:", BIG), 160),
+    (render_text("LMB: Place   RMB: Demolish"), 188),
+    (render_text("1-4: Select building"), 208),
+    (render_text("Space: Pause/Resume"), 228),
+    (render_text("S: Save  L: Load  R: Reset"), 248),
+)
+TIP_TEXT = render_text("Tip: Houses give population; Shops need customers.", color=LIGHT_GRAY)
+# (name + cost, stats) label pair for each building button, in BUILDINGS order
+BUILDING_LABELS = tuple(
+    (
+        render_text(f"{b.id}. {b.name}  (${b.cost})"),
+        render_text(f"Income: {b.income}/s  Pop:+{b.pop}  E:{b.energy}", SMALL_FONT),
+    )
+    for b in BUILDINGS
+)
+
+def _make_grid_bg():
+    # the grid never changes, so render it once and blit the result every frame
+    w, h = GRID_PX_W, GRID_PX_H
+    surf = pygame.Surface((w, h)).convert()
+    bounds = surf.get_rect()
+    surf.fill((40, 40, 48))
+    for x in range(GRID_W):
+        for y in range(GRID_H):
+            surf.fill((28, 28, 34), (x * CELL + 3, y * CELL + 3, CELL - 6, CELL - 6))
+    # cell outlines: each boundary is 2px wide (1px from each neighbouring cell),
+    # clipped to 1px at the outer edges
+    for x in range(GRID_W + 1):
+        surf.fill((60, 60, 70), pygame.Rect(x * CELL - 1, 0, 2, h).clip(bounds))
+    for y in range(GRID_H + 1):
+        surf.fill((60, 60, 70), pygame.Rect(0, y * CELL - 1, w, 2).clip(bounds))
+    return surf
+
+GRID_BG = _make_grid_bg()
+
+# ------ Input ------
+TICK_EVENT = pygame.event.custom_type()
+
+def set_tick_timer(city):
+    # post TICK_EVENT every tick_interval while the city runs, stop it while paused
+    pygame.time.set_timer(TICK_EVENT, int(city.tick_interval * 1000) if city.running else 0)
+
+def _select(bid):
+    return lambda c: setattr(c, "selected_building", bid)
+
+# KEYDOWN key -> action(city); actions returning (ok, msg) show msg in the UI
+KEY_ACTIONS = {
+    pygame.K_SPACE: lambda c: setattr(c, "running", not c.running),
+    pygame.K_s: lambda c: c.save(),
+    pygame.K_l: lambda c: c.load(),
+    pygame.K_r: City.reset,
+    pygame.K_1: _select(1), pygame.K_KP1: _select(1),
+    pygame.K_2: _select(2), pygame.K_KP2: _select(2),
+    pygame.K_3: _select(3), pygame.K_KP3: _select(3),
+    pygame.K_4: _select(4), pygame.K_KP4: _select(4),
+}
 
 # ------ Main Loop ------
 def main():
@@ -263,49 +416,43 @@ def main():
     ui_message_timer = 0.0
 
     running = True
-    last_time = time.time()
-    tick_accum = 0.0
+    last_hover = None
+    set_tick_timer(city)
 
     while running:
         dt = clock.tick(FPS) / 1000.0
-        now = time.time()
-        tick_dt = now - last_time
-        last_time = now
-        if city.running:
-            city.tick_accum += tick_dt
 
         # events
         for e in pygame.event.get():
+            if e.type != pygame.MOUSEMOTION:
+                # key presses, clicks and window events can all change what is shown
+                city.dirty = True
             if e.type == pygame.QUIT:
                 running = False
             elif e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_ESCAPE:
                     running = False
-                elif e.key == pygame.K_SPACE:
-                    city.running = not city.running
-                elif e.key == pygame.K_s:
-                    ok, msg = city.save()
-                    last_ui_message = msg
-                    ui_message_timer = 2.0
-                elif e.key == pygame.K_l:
-                    ok, msg = city.load()
-                    last_ui_message = msg
-                    ui_message_timer = 2.0
-                elif e.key == pygame.K_r:
-                    city.reset()
-                elif e.key in (pygame.K_1, pygame.K_KP1):
-                    city.selected_building = 1
-                elif e.key in (pygame.K_2, pygame.K_KP2):
-                    city.selected_building = 2
-                elif e.key in (pygame.K_3, pygame.K_KP3):
-                    city.selected_building = 3
-                elif e.key in (pygame.K_4, pygame.K_KP4):
-                    city.selected_building = 4
+                else:
+                    action = KEY_ACTIONS.get(e.key)
+                    if action:
+                        was_running = city.running
+                        result = action(city)
+                        if city.running != was_running:
+                            set_tick_timer(city)
+                        if result:
+                            ok, msg = result
+                            last_ui_message = msg
+                            ui_message_timer = 2.0
+            elif e.type == TICK_EVENT and city.running:
+                info = city.tick()
+                # show brief feedback
+                last_ui_message = f"+${info['gained']}  pop:{info['pop']}  E:{info['energy']}"
+                ui_message_timer = 2.0
             elif e.type == pygame.MOUSEBUTTONDOWN:
                 mx, my = pygame.mouse.get_pos()
                 gx = mx // CELL
                 gy = my // CELL
-                if mx < GRID_W * CELL and my < GRID_H * CELL:
+                if mx < GRID_PX_W and my < GRID_PX_H:
                     if e.button == 1:  # left click - place
                         ok, msg = city.place(gx, gy, city.selected_building)
                         last_ui_message = msg
@@ -315,84 +462,91 @@ def main():
                         last_ui_message = msg
                         ui_message_timer = 2.0
 
-        # ticks
-        if city.running:
-            while city.tick_accum >= city.tick_interval:
-                info = city.tick()
-                city.tick_accum -= city.tick_interval
-                # show brief feedback
-                last_ui_message = f"+${info['gained']}  pop:{info['pop']}  E:{info['energy']}"
-                ui_message_timer = 2.0
+        # hovered grid cell, or None when the mouse is over the UI panel
+        mx, my = pygame.mouse.get_pos()
+        hover = (mx // CELL, my // CELL) if mx < GRID_PX_W and my < GRID_PX_H else None
+        hover_changed = hover != last_hover
+        last_hover = hover
+
+        # the message itself is static; only its expiry needs a redraw
+        if ui_message_timer > 0:
+            ui_message_timer -= dt
+            if ui_message_timer <= 0:
+                city.dirty = True
+
+        # nothing visible changed since the last frame
+        if not (city.dirty or hover_changed):
+            continue
+        city.dirty = False
 
         # render
         screen.fill((30, 30, 36))
 
         # Draw grid background
-        for x in range(GRID_W):
-            for y in range(GRID_H):
-                rect = pygame.Rect(x * CELL, y * CELL, CELL, CELL)
-                pygame.draw.rect(screen, (40, 40, 48), rect)
-                pygame.draw.rect(screen, (28, 28, 34), rect.inflate(-6, -6))
-                pygame.draw.rect(screen, (60, 60, 70), rect, 1)
+        screen.blit(GRID_BG, (0, 0))
 
         # Draw buildings
-        for pb in city.buildings:
-            rect = pygame.Rect(pb.x * CELL, pb.y * CELL, CELL, CELL)
-            draw_building_icon(screen, rect, pb.bid)
+        screen.blits(city.blit_seq, doreturn=False)
+
+        # Shapes: drawn in one batch under a single lock. Blits fail on a
+        # locked surface, so all text is drawn after unlocking.
+        ui_x = GRID_PX_W
+        screen.lock()
 
         # Draw grid hover / preview
-        mx, my = pygame.mouse.get_pos()
-        gx = mx // CELL
-        gy = my // CELL
-        if mx < GRID_W * CELL and my < GRID_H * CELL:
+        if hover is not None:
+            gx, gy = hover
             preview_rect = pygame.Rect(gx * CELL + 2, gy * CELL + 2, CELL - 4, CELL - 4)
             pygame.draw.rect(screen, (255, 255, 255, 40), preview_rect, 2)
-            # cost preview
-            bdef = BUILDING_BY_ID[city.selected_building]
-            cost_color = GREEN if city.money >= bdef.cost and city.can_place(gx, gy) else RED
-            draw_text(screen, f"{bdef.name} (${bdef.cost})", (10, HEIGHT - 70), color=WHITE)
 
         # UI panel
-        ui_x = GRID_W * CELL
         ui_rect = pygame.Rect(ui_x, 0, UI_WIDTH, HEIGHT)
-        pygame.draw.rect(screen, (22, 22, 28), ui_rect)
+        screen.fill((22, 22, 28), ui_rect)
         pygame.draw.line(screen, (60, 60, 70), (ui_x, 0), (ui_x, HEIGHT), 2)
 
-        # Top stats
-        draw_text(screen, "City Tycoon (mini)", (ui_x + 12, 12), font=BIG, color=YELLOW)
-        draw_text(screen, f"Money: ${city.money}", (ui_x + 12, 50))
-        draw_text(screen, f"Population: {city.population}", (ui_x + 12, 74))
-        draw_text(screen, f"Happiness: {int(city.happiness*100)}%", (ui_x + 12, 98))
-        energy_color = GREEN if city.energy >= 0 else RED
-        draw_text(screen, f"Energy: {city.energy}", (ui_x + 12, 122), color=energy_color)
-
-        # Controls/help
-        draw_text(screen, "Controls:", (ui_x + 12, 160), font=BIG)
-        draw_text(screen, "LMB: Place   RMB: Demolish", (ui_x + 12, 188))
-        draw_text(screen, "1-4: Select building", (ui_x + 12, 208))
-        draw_text(screen, "Space: Pause/Resume", (ui_x + 12, 228))
-        draw_text(screen, "S: Save  L: Load  R: Reset", (ui_x + 12, 248))
-
         # Building buttons
         bx = ui_x + 12
         by = 290
         for b in BUILDINGS:
             brect = pygame.Rect(bx, by, UI_WIDTH - 24, 48)
-            pygame.draw.rect(screen, (40, 40, 50), brect)
+            screen.fill((40, 40, 50), brect)
             if city.selected_building == b.id:
                 pygame.draw.rect(screen, BLUE, brect, 3)
+            by += 58
+
+        screen.unlock()
+
+        # cost preview
+        if hover is not None:
+            bdef = BUILDING_BY_ID[city.selected_building]
+            draw_text(screen, f"{bdef.name} (${bdef.cost})", (10, HEIGHT - 70), color=WHITE)
+
+        # Top stats
+        screen.blit(TITLE_TEXT, (ui_x + 12, 12))
+        screen.blit(city.stat_surface("money", city.money, "Money: ${}"), (ui_x + 12, 50))
+        screen.blit(city.stat_surface("population", city.population, "Population: {}"), (ui_x + 12, 74))
+        screen.blit(city.stat_surface("happiness", int(city.happiness*100), "Happiness: {}%"), (ui_x + 12, 98))
+        energy_color = GREEN if city.energy >= 0 else RED
+        screen.blit(city.stat_surface("energy", city.energy, "Energy: {}", color=energy_color), (ui_x + 12, 122))
+
+        # Controls/help
+        for txt, y in CONTROLS_TEXT:
+            screen.blit(txt, (ui_x + 12, y))
+
+        # Building button labels
+        by = 290
+        for name_txt, stats_txt in BUILDING_LABELS:
             # name + cost
-            draw_text(screen, f"{b.id}. {b.name}  (${b.cost})", (bx + 8, by + 6))
-            draw_text(screen, f"Income: {b.income}/s  Pop:+{b.pop}  E:{b.energy}", (bx + 8, by + 28), font=pygame.font.SysFont("consolas", 14))
+            screen.blit(name_txt, (bx + 8, by + 6))
+            screen.blit(stats_txt, (bx + 8, by + 28))
             by += 58
 
         # UI message
         if ui_message_timer > 0 and last_ui_message:
             draw_text(screen, last_ui_message, (ui_x + 12, HEIGHT - 30), color=WHITE)
-            ui_message_timer -= dt
         else:
             # draw small tip
-            draw_text(screen, "Tip: Houses give population; Shops need customers.", (ui_x + 12, HEIGHT - 30), color=LIGHT_GRAY)
+            screen.blit(TIP_TEXT, (ui_x + 12, HEIGHT - 30))
 
         # small status at bottom left for selected build
         b = BUILDING_BY_ID[city.selected_building]